@@ -33,7 +33,9 @@ const SCREENPLAY_CONSTANTS = {
     PDF: {
         POSITION_TOLERANCE: 5,
         MAX_PAGES_WARNING: 200,
-        DEFAULT_VIEWPORT_SCALE: 1.5
+        DEFAULT_VIEWPORT_SCALE: 1.5,
+        PAGE_CONCURRENCY: 4,
+        LOAD_TIMEOUT_MS: 30000
     },
     
     // Content validation limits
@@ -59,6 +61,8 @@ const SCREENPLAY_CONSTANTS = {
     // File type validation
     FILE_TYPES: {
         SUPPORTED_PDF_TYPE: 'application/pdf',
+        PDF_SIGNATURE: '%PDF-',
+        PDF_SIGNATURE_SEARCH_BYTES: 1024,
         MAX_FILE_SIZE_MB: 50
     }
 };
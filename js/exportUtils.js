@@ -2,6 +2,35 @@
  * Export utilities for screenplay analysis data
  */
 
+// Replacement for each XML special character, applied in a single scan
+const XML_ESCAPES = {
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;'
+};
+const XML_ESCAPE_PATTERN = /[&<>"']/g;
+
+// Characters that force a CSV value to be quoted
+const CSV_QUOTE_PATTERN = /[",\n]/;
+
+// Scene CSV columns, in output order; escaped columns go through escapeCsvValue
+const SCENE_CSV_COLUMNS = [
+    { header: 'Scene Number', get: scene => scene.number || '', escape: true },
+    { header: 'Location', get: scene => scene.location || '', escape: true },
+    { header: 'Time of Day', get: scene => scene.timeOfDay || '', escape: true },
+    { header: 'Slugline', get: scene => scene.slugline || '', escape: true },
+    { header: 'Characters', get: scene => scene.characters.join('; ') || '', escape: true },
+    { header: 'Estimated Length (1/8 pages)', get: scene => scene.estimatedLength || 0, escape: false },
+    { header: 'Page Number', get: scene => scene.pageNumber || '', escape: false },
+    { header: 'Content', get: scene => scene.content || '', escape: true }
+];
+const SCENE_ID_CSV_COLUMNS = [
+    { header: 'Scene ID', get: scene => scene.id || '', escape: true },
+    ...SCENE_CSV_COLUMNS
+];
+
 class ExportUtils {
     constructor() {
         this.formats = ['csv', 'json', 'xml'];
@@ -15,39 +44,14 @@ class ExportUtils {
             throw new Error('No scenes to export');
         }
 
-        const headers = [
-            'Scene Number',
-            'Location',
-            'Time of Day',
-            'Slugline',
-            'Characters',
-            'Estimated Length (1/8 pages)',
-            'Page Number',
-            'Content'
-        ];
-
-        // Add optional headers
-        if (options.includeIds) {
-            headers.unshift('Scene ID');
-        }
-
-        const csvRows = [headers.join(',')];
+        const columns = options.includeIds ? SCENE_ID_CSV_COLUMNS : SCENE_CSV_COLUMNS;
+        const csvRows = [columns.map(column => column.header).join(',')];
 
         for (const scene of scenes) {
-            const row = [
-                this.escapeCsvValue(scene.number || ''),
-                this.escapeCsvValue(scene.location || ''),
-                this.escapeCsvValue(scene.timeOfDay || ''),
-                this.escapeCsvValue(scene.slugline || ''),
-                this.escapeCsvValue(scene.characters.join('; ') || ''),
-                scene.estimatedLength || 0,
-                scene.pageNumber || '',
-                this.escapeCsvValue(scene.content || '')
-            ];
-
-            if (options.includeIds) {
-                row.unshift(this.escapeCsvValue(scene.id || ''));
-            }
+            const row = columns.map(column => {
+                const value = column.get(scene);
+                return column.escape ? this.escapeCsvValue(value) : value;
+            });
 
             csvRows.push(row.join(','));
         }
@@ -124,88 +128,89 @@ class ExportUtils {
      * Export analysis to XML format
      */
     exportAnalysisXML(analysisData) {
-        let xml = '<?xml version="1.0" encoding="UTF-8"?>\n';
-        xml += '<screenplay_analysis>\n';
+        // Collect fragments and join once at the end
+        const parts = ['<?xml version="1.0" encoding="UTF-8"?>\n'];
+        parts.push('<screenplay_analysis>\n');
         
         // Metadata
         if (analysisData.metadata) {
-            xml += '  <metadata>\n';
+            parts.push('  <metadata>\n');
             for (const [key, value] of Object.entries(analysisData.metadata)) {
-                xml += `    <${key}>${this.escapeXml(value)}</${key}>\n`;
+                parts.push(`    <${key}>${this.escapeXml(value)}</${key}>\n`);
             }
-            xml += '  </metadata>\n';
+            parts.push('  </metadata>\n');
         }
 
         // Summary
         if (analysisData.summary) {
-            xml += '  <summary>\n';
+            parts.push('  <summary>\n');
             for (const [key, value] of Object.entries(analysisData.summary)) {
                 if (Array.isArray(value)) {
-                    xml += `    <${key}>\n`;
+                    parts.push(`    <${key}>\n`);
                     for (const item of value) {
-                        xml += `      <item>${this.escapeXml(JSON.stringify(item))}</item>\n`;
+                        parts.push(`      <item>${this.escapeXml(JSON.stringify(item))}</item>\n`);
                     }
-                    xml += `    </${key}>\n`;
+                    parts.push(`    </${key}>\n`);
                 } else {
-                    xml += `    <${key}>${this.escapeXml(value)}</${key}>\n`;
+                    parts.push(`    <${key}>${this.escapeXml(value)}</${key}>\n`);
                 }
             }
-            xml += '  </summary>\n';
+            parts.push('  </summary>\n');
         }
 
         // Scenes
-        xml += '  <scenes>\n';
+        parts.push('  <scenes>\n');
         for (const scene of analysisData.scenes || []) {
-            xml += '    <scene>\n';
-            xml += `      <id>${this.escapeXml(scene.id)}</id>\n`;
-            xml += `      <number>${this.escapeXml(scene.number)}</number>\n`;
-            xml += `      <location>${this.escapeXml(scene.location)}</location>\n`;
-            xml += `      <time_of_day>${this.escapeXml(scene.timeOfDay)}</time_of_day>\n`;
-            xml += `      <slugline>${this.escapeXml(scene.slugline)}</slugline>\n`;
-            xml += `      <estimated_length>${scene.estimatedLength}</estimated_length>\n`;
-            xml += `      <page_number>${scene.pageNumber || ''}</page_number>\n`;
-            xml += '      <characters>\n';
+            parts.push('    <scene>\n');
+            parts.push(`      <id>${this.escapeXml(scene.id)}</id>\n`);
+            parts.push(`      <number>${this.escapeXml(scene.number)}</number>\n`);
+            parts.push(`      <location>${this.escapeXml(scene.location)}</location>\n`);
+            parts.push(`      <time_of_day>${this.escapeXml(scene.timeOfDay)}</time_of_day>\n`);
+            parts.push(`      <slugline>${this.escapeXml(scene.slugline)}</slugline>\n`);
+            parts.push(`      <estimated_length>${scene.estimatedLength}</estimated_length>\n`);
+            parts.push(`      <page_number>${scene.pageNumber || ''}</page_number>\n`);
+            parts.push('      <characters>\n');
             for (const character of scene.characters || []) {
-                xml += `        <character>${this.escapeXml(character)}</character>\n`;
+                parts.push(`        <character>${this.escapeXml(character)}</character>\n`);
             }
-            xml += '      </characters>\n';
-            xml += `      <content>${this.escapeXml(scene.content)}</content>\n`;
-            xml += '    </scene>\n';
+            parts.push('      </characters>\n');
+            parts.push(`      <content>${this.escapeXml(scene.content)}</content>\n`);
+            parts.push('    </scene>\n');
         }
-        xml += '  </scenes>\n';
+        parts.push('  </scenes>\n');
 
         // Characters
-        xml += '  <characters>\n';
+        parts.push('  <characters>\n');
         for (const character of analysisData.characters || []) {
-            xml += '    <character>\n';
-            xml += `      <name>${this.escapeXml(character.name)}</name>\n`;
-            xml += `      <total_appearances>${character.totalAppearances}</total_appearances>\n`;
-            xml += '      <scenes>\n';
+            parts.push('    <character>\n');
+            parts.push(`      <name>${this.escapeXml(character.name)}</name>\n`);
+            parts.push(`      <total_appearances>${character.totalAppearances}</total_appearances>\n`);
+            parts.push('      <scenes>\n');
             for (const sceneId of character.scenes || []) {
-                xml += `        <scene_id>${this.escapeXml(sceneId)}</scene_id>\n`;
+                parts.push(`        <scene_id>${this.escapeXml(sceneId)}</scene_id>\n`);
             }
-            xml += '      </scenes>\n';
-            xml += '    </character>\n';
+            parts.push('      </scenes>\n');
+            parts.push('    </character>\n');
         }
-        xml += '  </characters>\n';
+        parts.push('  </characters>\n');
 
         // Locations
-        xml += '  <locations>\n';
+        parts.push('  <locations>\n');
         for (const location of analysisData.locations || []) {
-            xml += '    <location>\n';
-            xml += `      <name>${this.escapeXml(location.name)}</name>\n`;
-            xml += `      <total_uses>${location.totalUses}</total_uses>\n`;
-            xml += '      <scenes>\n';
+            parts.push('    <location>\n');
+            parts.push(`      <name>${this.escapeXml(location.name)}</name>\n`);
+            parts.push(`      <total_uses>${location.totalUses}</total_uses>\n`);
+            parts.push('      <scenes>\n');
             for (const sceneId of location.scenes || []) {
-                xml += `        <scene_id>${this.escapeXml(sceneId)}</scene_id>\n`;
+                parts.push(`        <scene_id>${this.escapeXml(sceneId)}</scene_id>\n`);
             }
-            xml += '      </scenes>\n';
-            xml += '    </location>\n';
+            parts.push('      </scenes>\n');
+            parts.push('    </location>\n');
         }
-        xml += '  </locations>\n';
+        parts.push('  </locations>\n');
 
-        xml += '</screenplay_analysis>';
-        return xml;
+        parts.push('</screenplay_analysis>');
+        return parts.join('');
     }
 
     /**
@@ -246,7 +251,7 @@ class ExportUtils {
         const stringValue = String(value);
         
         // If the value contains comma, quote, or newline, wrap in quotes and escape quotes
-        if (stringValue.includes(',') || stringValue.includes('"') || stringValue.includes('\n')) {
+        if (CSV_QUOTE_PATTERN.test(stringValue)) {
             return '"' + stringValue.replace(/"/g, '""') + '"';
         }
         
@@ -261,12 +266,7 @@ class ExportUtils {
             return '';
         }
         
-        return String(value)
-            .replace(/&/g, '&amp;')
-            .replace(/</g, '&lt;')
-            .replace(/>/g, '&gt;')
-            .replace(/"/g, '&quot;')
-            .replace(/'/g, '&#39;');
+        return String(value).replace(XML_ESCAPE_PATTERN, char => XML_ESCAPES[char]);
     }
 
     /**
@@ -324,12 +324,13 @@ class ExportUtils {
      */
     downloadExportPackage(analysisData, formats = ['csv', 'json']) {
         const exportPackage = this.createExportPackage(analysisData, formats);
+        const staggerDelay = SCREENPLAY_CONSTANTS.UI.DOWNLOAD_STAGGER_DELAY;
         
-        for (const [key, exportData] of Object.entries(exportPackage)) {
+        Object.values(exportPackage).forEach((exportData, index) => {
             setTimeout(() => {
                 this.downloadFile(exportData.data, exportData.filename, exportData.mimeType);
-            }, 100 * Object.keys(exportPackage).indexOf(key)); // Stagger downloads
-        }
+            }, staggerDelay * index); // Stagger downloads
+        });
     }
 }
 
@@ -9,6 +9,9 @@ class ScreenplayAnalyzer {
         this.exportUtils = new ExportUtils();
         this.currentAnalysis = null;
         
+        // Rendered scenes markup, reused until the analysis changes
+        this.scenesHtmlCache = null;
+        
         // Operation management for race condition prevention
         this.currentOperation = null;
         this.operationId = 0;
@@ -44,6 +47,8 @@ class ScreenplayAnalyzer {
         // File input change
         this.elements.fileInput.addEventListener('change', (event) => {
             this.handleFileSelect(event.target.files[0]);
+            // Reset so choosing the same file again still fires a change event
+            event.target.value = '';
         });
 
         // Drag and drop
@@ -83,7 +88,19 @@ class ScreenplayAnalyzer {
             return;
         }
 
+        // Reject oversize files before reading any of their contents
+        const maxSizeMB = SCREENPLAY_CONSTANTS.FILE_TYPES.MAX_FILE_SIZE_MB;
+        if (file.size > maxSizeMB * 1024 * 1024) {
+            this.showError(`File is too large. Maximum size is ${maxSizeMB} MB.`);
+            return;
+        }
+
         try {
+            if (!(await this.pdfExtractor.hasPdfSignature(file))) {
+                this.showError('The selected file is not a valid PDF.');
+                return;
+            }
+
             // Show file info
             this.displayFileInfo(file);
 
@@ -153,6 +170,11 @@ class ScreenplayAnalyzer {
 
             // Analyze scenes
             this.updateProgress(95, 'Analyzing scenes...');
+
+            // Scene analysis runs synchronously; let the progress update paint first
+            await this.yieldToBrowser();
+            if (operation.cancelled || this.currentOperation !== operation) return;
+
             const analysisResult = await this.sceneAnalyzer.analyzeText(extractedData);
 
             // Final check before displaying results
@@ -160,6 +182,9 @@ class ScreenplayAnalyzer {
 
             // Update current analysis and display results
             this.currentAnalysis = analysisResult;
+            // Drop markup rendered for the previous analysis straight away, since
+            // displayResults() may not run for this one (see displayResultsWhenReady)
+            this.invalidateRenderCache();
             this.updateProgress(100, 'Complete!');
             
             // Use a more controlled approach instead of setTimeout
@@ -204,6 +229,14 @@ class ScreenplayAnalyzer {
         }, SCREENPLAY_CONSTANTS.UI.PROGRESS_ANIMATION_DELAY); // Reduced from 500ms for better responsiveness
     }
 
+    /**
+     * Give the browser a chance to render before continuing long-running work
+     * Uses a macrotask rather than requestAnimationFrame, which never fires in hidden tabs
+     */
+    yieldToBrowser() {
+        return new Promise(resolve => setTimeout(resolve, 0));
+    }
+
     /**
      * Update progress bar and status
      */
@@ -244,6 +277,9 @@ class ScreenplayAnalyzer {
         this.elements.processingSection.style.display = 'none';
         this.elements.resultsSection.style.display = 'block';
 
+        // Every path that changes the analysis re-renders through here
+        this.invalidateRenderCache();
+
         // Display scenes by default
         this.displayScenes();
         this.displayCharacters();
@@ -257,6 +293,13 @@ class ScreenplayAnalyzer {
         }
     }
 
+    /**
+     * Drop cached markup so the next display call rebuilds it
+     */
+    invalidateRenderCache() {
+        this.scenesHtmlCache = null;
+    }
+
     /**
      * Display scenes list with validation
      */
@@ -266,6 +309,12 @@ class ScreenplayAnalyzer {
             return;
         }
 
+        // Re-displaying unchanged data (e.g. toggling edit mode) reuses the markup
+        if (this.scenesHtmlCache !== null) {
+            this.elements.scenesList.innerHTML = this.scenesHtmlCache;
+            return;
+        }
+
         const { scenes, summary } = this.currentAnalysis;
         
         // Validate scenes array
@@ -315,6 +364,7 @@ class ScreenplayAnalyzer {
         }
 
         html += '</div>';
+        this.scenesHtmlCache = html;
         this.elements.scenesList.innerHTML = html;
     }
 
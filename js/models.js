@@ -2,6 +2,39 @@
  * Data models for screenplay analysis
  */
 
+// Words that mark an all-caps line as a direction rather than a character cue
+const NON_CHARACTER_WORDS = [
+    'FADE', 'CUT', 'DISSOLVE', 'SMASH', 'MATCH', 'INSERT', 'CLOSE',
+    'WIDE', 'MEDIUM', 'TIGHT', 'ANGLE', 'SHOT', 'MONTAGE', 'SERIES',
+    'VARIOUS', 'LATER', 'MEANWHILE', 'ELSEWHERE', 'BACK', 'REVERSE',
+    'POV', 'POINT OF VIEW', 'TITLE', 'END', 'BEGIN', 'START'
+];
+
+// All words combined into one alternation so each name is scanned once
+const NON_CHARACTER_PATTERN = new RegExp(NON_CHARACTER_WORDS.join('|'));
+
+// Screenplay slugline: "INT./EXT. LOCATION - TIME" or "LOCATION - TIME".
+// The optional prefix is tried first, so one match covers both forms.
+const SLUGLINE_PATTERN = /^(?:(INT\.|EXT\.)\s+)?([^-]+)\s*-\s*(.+)$/i;
+
+// Character names: a line that is all caps (typically followed by dialogue)
+const CHARACTER_NAME_PATTERN = /^\s*([A-Z][A-Z\s\-'.]{1,30})\s*$/gm;
+
+// Standard time of day values keyed by their lowercase spelling
+const TIME_OF_DAY_MAP = {
+    'day': 'DAY',
+    'night': 'NIGHT',
+    'dawn': 'DAWN',
+    'dusk': 'DUSK',
+    'morning': 'MORNING',
+    'afternoon': 'AFTERNOON',
+    'evening': 'EVENING',
+    'continuous': 'CONTINUOUS',
+    'later': 'LATER',
+    'same time': 'SAME TIME'
+};
+const TIME_OF_DAY_ENTRIES = Object.entries(TIME_OF_DAY_MAP);
+
 class Scene {
     constructor(data = {}) {
         this.id = data.id || null;
@@ -32,9 +65,8 @@ class Scene {
     hashCode(str) {
         let hash = 0;
         for (let i = 0; i < str.length; i++) {
-            const char = str.charCodeAt(i);
-            hash = ((hash << 5) - hash) + char;
-            hash = hash & hash; // Convert to 32-bit integer
+            // hash * 31 + char, kept in 32-bit integer range in one step
+            hash = (Math.imul(31, hash) + str.charCodeAt(i)) | 0;
         }
         return Math.abs(hash).toString(16);
     }
@@ -45,34 +77,29 @@ class Scene {
     parseSlugline() {
         if (!this.slugline) return;
 
-        // Common screenplay slugline patterns
-        const patterns = [
-            // INT./EXT. LOCATION - TIME
-            /^(INT\.|EXT\.)\s+([^-]+)\s*-\s*(.+)$/i,
-            // LOCATION - TIME
-            /^([^-]+)\s*-\s*(.+)$/i
-        ];
-
-        for (const pattern of patterns) {
-            const match = this.slugline.match(pattern);
-            if (match) {
-                if (match.length === 4) {
-                    // INT./EXT. pattern
-                    this.location = match[2].trim();
-                    this.timeOfDay = match[3].trim();
-                } else if (match.length === 3) {
-                    // Simple location - time pattern
-                    this.location = match[1].trim();
-                    this.timeOfDay = match[2].trim();
-                }
-                break;
-            }
+        const parsed = this.matchSlugline(this.slugline);
+        if (parsed) {
+            this.location = parsed.location;
+            this.timeOfDay = parsed.timeOfDay;
         }
 
         // Normalize time of day
         this.timeOfDay = this.normalizeTimeOfDay(this.timeOfDay);
     }
 
+    /**
+     * Match a slugline against known patterns
+     * @returns {Object|null} - Raw location and time of day, or null if unrecognized
+     */
+    matchSlugline(slugline) {
+        const match = slugline.match(SLUGLINE_PATTERN);
+        if (!match) {
+            return null;
+        }
+
+        return { location: match[2].trim(), timeOfDay: match[3].trim() };
+    }
+
     /**
      * Normalize time of day to standard values
      */
@@ -81,27 +108,13 @@ class Scene {
         
         const timeStr = time.toLowerCase().trim();
         
-        // Time mappings
-        const timeMap = {
-            'day': 'DAY',
-            'night': 'NIGHT',
-            'dawn': 'DAWN',
-            'dusk': 'DUSK',
-            'morning': 'MORNING',
-            'afternoon': 'AFTERNOON',
-            'evening': 'EVENING',
-            'continuous': 'CONTINUOUS',
-            'later': 'LATER',
-            'same time': 'SAME TIME'
-        };
-
         // Direct mapping
-        if (timeMap[timeStr]) {
-            return timeMap[timeStr];
+        if (TIME_OF_DAY_MAP[timeStr]) {
+            return TIME_OF_DAY_MAP[timeStr];
         }
 
         // Partial matching
-        for (const [key, value] of Object.entries(timeMap)) {
+        for (const [key, value] of TIME_OF_DAY_ENTRIES) {
             if (timeStr.includes(key)) {
                 return value;
             }
@@ -118,15 +131,13 @@ class Scene {
 
         const characters = new Set();
         
-        // Match character names (typically all caps followed by dialogue)
-        const characterPattern = /^\s*([A-Z][A-Z\s\-'.]{1,30})\s*$/gm;
-        let match;
-        
-        while ((match = characterPattern.exec(this.content)) !== null) {
+        // matchAll iterates a copy, so the shared pattern's lastIndex is untouched
+        for (const match of this.content.matchAll(CHARACTER_NAME_PATTERN)) {
             const name = match[1].trim();
             
-            // Filter out common non-character elements
-            if (!this.isNonCharacterElement(name)) {
+            // Filter out common non-character elements; repeat speakers are
+            // already known to pass, so only new names need the check
+            if (!characters.has(name) && !this.isNonCharacterElement(name)) {
                 characters.add(name);
             }
         }
@@ -139,16 +150,7 @@ class Scene {
      * Check if a name is likely not a character
      */
     isNonCharacterElement(name) {
-        const nonCharacterWords = [
-            'FADE', 'CUT', 'DISSOLVE', 'SMASH', 'MATCH', 'INSERT', 'CLOSE',
-            'WIDE', 'MEDIUM', 'TIGHT', 'ANGLE', 'SHOT', 'MONTAGE', 'SERIES',
-            'VARIOUS', 'LATER', 'MEANWHILE', 'ELSEWHERE', 'BACK', 'REVERSE',
-            'POV', 'POINT OF VIEW', 'TITLE', 'END', 'BEGIN', 'START'
-        ];
-
-        return nonCharacterWords.some(word => 
-            name.includes(word) || name.length < 2 || name.length > 30
-        );
+        return name.length < 2 || name.length > 30 || NON_CHARACTER_PATTERN.test(name);
     }
 
     /**
@@ -6,6 +6,8 @@ class PDFExtractor {
     constructor() {
         this.textProcessor = new TextProcessor();
         this.progressCallback = null;
+        this.lastExtraction = null;
+        this.pdfWorker = null;
         
         // Initialize PDF.js worker
         if (typeof pdfjsLib !== 'undefined') {
@@ -25,11 +27,20 @@ class PDFExtractor {
      * Extract text from PDF file
      */
     async extractTextFromPDF(file) {
+        let pdf = null;
+
         try {
             if (!file || file.type !== 'application/pdf') {
                 throw new Error('Invalid PDF file');
             }
 
+            // Re-selecting the same file reuses the text extracted last time
+            const fileKey = this.getFileKey(file);
+            if (this.lastExtraction && this.lastExtraction.fileKey === fileKey) {
+                this.updateProgress(90, 'Using previously extracted text...');
+                return this.lastExtraction.result;
+            }
+
             this.updateProgress(0, 'Loading PDF...');
 
             // Read file as array buffer
@@ -38,16 +49,13 @@ class PDFExtractor {
             this.updateProgress(10, 'Parsing PDF document...');
 
             // Load PDF document
-            const pdf = await pdfjsLib.getDocument(arrayBuffer).promise;
+            pdf = await this.openDocument(arrayBuffer);
             const numPages = pdf.numPages;
 
             this.updateProgress(20, `Extracting text from ${numPages} pages...`);
 
             // Extract text from all pages
-            const textContent = [];
-            
-            for (let pageNum = 1; pageNum <= numPages; pageNum++) {
-                const page = await pdf.getPage(pageNum);
+            const textContent = await this.mapPages(pdf, async (page, pageNum) => {
                 const textContentObj = await page.getTextContent();
                 
                 // Extract text items and combine them
@@ -55,12 +63,12 @@ class PDFExtractor {
                     .map(item => item.str)
                     .join(' ');
                 
-                textContent.push(`\n--- PAGE ${pageNum} ---\n${pageText}`);
-                
+                return `\n--- PAGE ${pageNum} ---\n${pageText}`;
+            }, (completed) => {
                 // Update progress
-                const progress = 20 + (pageNum / numPages) * 60;
-                this.updateProgress(progress, `Processing page ${pageNum} of ${numPages}...`);
-            }
+                const progress = 20 + (completed / numPages) * 60;
+                this.updateProgress(progress, `Processing page ${completed} of ${numPages}...`);
+            });
 
             this.updateProgress(80, 'Cleaning and processing text...');
 
@@ -70,16 +78,24 @@ class PDFExtractor {
 
             this.updateProgress(90, 'Organizing content...');
 
-            return {
+            const result = {
                 text: cleanedText,
                 pageCount: numPages,
                 wordCount: cleanedText.split(/\s+/).length,
                 characterCount: cleanedText.length
             };
 
+            this.lastExtraction = { fileKey: fileKey, result: result };
+            return result;
+
         } catch (error) {
             console.error('PDF extraction error:', error);
             throw new Error(`Failed to extract text from PDF: ${error.message}`);
+        } finally {
+            // Release the document's resources in the shared worker
+            if (pdf) {
+                pdf.destroy();
+            }
         }
     }
 
@@ -87,17 +103,16 @@ class PDFExtractor {
      * Extract text with layout information (more advanced)
      */
     async extractTextWithLayout(file) {
+        let pdf = null;
+
         try {
             this.updateProgress(0, 'Loading PDF for layout analysis...');
 
             const arrayBuffer = await this.fileToArrayBuffer(file);
-            const pdf = await pdfjsLib.getDocument(arrayBuffer).promise;
+            pdf = await this.openDocument(arrayBuffer);
             const numPages = pdf.numPages;
 
-            const pages = [];
-
-            for (let pageNum = 1; pageNum <= numPages; pageNum++) {
-                const page = await pdf.getPage(pageNum);
+            const pages = await this.mapPages(pdf, async (page, pageNum) => {
                 const textContent = await page.getTextContent();
                 const viewport = page.getViewport({ scale: 1.0 });
 
@@ -124,7 +139,7 @@ class PDFExtractor {
                 const lines = this.groupTextIntoLines(textItems);
                 const pageText = lines.join('\n');
 
-                pages.push({
+                return {
                     pageNumber: pageNum,
                     text: pageText,
                     viewport: {
@@ -132,11 +147,11 @@ class PDFExtractor {
                         height: viewport.height
                     },
                     textItems: textItems
-                });
-
-                const progress = 10 + (pageNum / numPages) * 80;
-                this.updateProgress(progress, `Analyzing layout of page ${pageNum}...`);
-            }
+                };
+            }, (completed) => {
+                const progress = 10 + (completed / numPages) * 80;
+                this.updateProgress(progress, `Analyzing layout of page ${completed}...`);
+            });
 
             this.updateProgress(90, 'Combining pages...');
 
@@ -156,6 +171,11 @@ class PDFExtractor {
         } catch (error) {
             console.error('Layout extraction error:', error);
             throw error;
+        } finally {
+            // Release the document's resources in the shared worker
+            if (pdf) {
+                pdf.destroy();
+            }
         }
     }
 
@@ -222,6 +242,102 @@ class PDFExtractor {
         return lineText;
     }
 
+    /**
+     * Open PDF data as a PDF.js document on the shared worker
+     * Callers destroy the document once they are done with it
+     * Loading is abandoned if it takes longer than PDF.LOAD_TIMEOUT_MS
+     */
+    async openDocument(arrayBuffer) {
+        const worker = this.getWorker();
+        const loadingTask = pdfjsLib.getDocument({
+            data: arrayBuffer,
+            worker: worker
+        });
+
+        const timeoutMs = SCREENPLAY_CONSTANTS.PDF.LOAD_TIMEOUT_MS;
+        let timeoutId = null;
+        const timeout = new Promise((resolve, reject) => {
+            timeoutId = setTimeout(() => {
+                loadingTask.destroy();
+                // The shared worker may still be busy parsing this file; terminate it
+                // so later loads start on a fresh worker instead of queueing behind it
+                worker.destroy();
+                if (this.pdfWorker === worker) {
+                    this.pdfWorker = null;
+                }
+                reject(new Error(`PDF did not finish loading within ${timeoutMs / 1000} seconds`));
+            }, timeoutMs);
+        });
+
+        try {
+            return await Promise.race([loadingTask.promise, timeout]);
+        } finally {
+            clearTimeout(timeoutId);
+        }
+    }
+
+    /**
+     * Get the shared PDF.js worker, creating it on first use
+     * Reusing one worker avoids spawning and loading a new one per document
+     */
+    getWorker() {
+        if (!this.pdfWorker || this.pdfWorker.destroyed) {
+            this.pdfWorker = new pdfjsLib.PDFWorker();
+        }
+        return this.pdfWorker;
+    }
+
+    /**
+     * Run processPage over every page with a bounded number in flight
+     * Results are returned in page order regardless of completion order
+     */
+    async mapPages(pdf, processPage, onPageDone) {
+        const numPages = pdf.numPages;
+        const results = new Array(numPages);
+        let nextPage = 1;
+        let completed = 0;
+
+        const runWorker = async () => {
+            while (nextPage <= numPages) {
+                const pageNum = nextPage++;
+                const page = await pdf.getPage(pageNum);
+                results[pageNum - 1] = await processPage(page, pageNum);
+                completed++;
+                if (onPageDone) {
+                    onPageDone(completed);
+                }
+            }
+        };
+
+        const workerCount = Math.min(SCREENPLAY_CONSTANTS.PDF.PAGE_CONCURRENCY, numPages);
+        const workers = [];
+        for (let i = 0; i < workerCount; i++) {
+            workers.push(runWorker());
+        }
+        await Promise.all(workers);
+
+        return results;
+    }
+
+    /**
+     * Identify a file by name, size and modification time
+     */
+    getFileKey(file) {
+        return `${file.name}:${file.size}:${file.lastModified}`;
+    }
+
+    /**
+     * Check for the PDF signature in the file's leading bytes, reading only those
+     * Like PDF.js, the header may appear anywhere in the first 1024 bytes
+     */
+    async hasPdfSignature(file) {
+        const { PDF_SIGNATURE, PDF_SIGNATURE_SEARCH_BYTES } = SCREENPLAY_CONSTANTS.FILE_TYPES;
+        const header = new Uint8Array(
+            await this.fileToArrayBuffer(file.slice(0, PDF_SIGNATURE_SEARCH_BYTES))
+        );
+        return String.fromCharCode(...header).includes(PDF_SIGNATURE);
+    }
+
     /**
      * Convert file to array buffer
      */
@@ -247,9 +363,11 @@ class PDFExtractor {
      * Get basic PDF information without extracting all text
      */
     async getPDFInfo(file) {
+        let pdf = null;
+
         try {
             const arrayBuffer = await this.fileToArrayBuffer(file);
-            const pdf = await pdfjsLib.getDocument(arrayBuffer).promise;
+            pdf = await this.openDocument(arrayBuffer);
             
             const info = await pdf.getMetadata();
             
@@ -266,6 +384,11 @@ class PDFExtractor {
         } catch (error) {
             console.error('PDF info extraction error:', error);
             throw error;
+        } finally {
+            // Release the document's resources in the shared worker
+            if (pdf) {
+                pdf.destroy();
+            }
         }
     }
 }
@@ -153,6 +153,9 @@ class Phase2Manager {
         const scenesList = document.getElementById('scenesList');
         if (!scenesList) return;
 
+        // Count scene numbers once so duplicate checks don't rescan all scenes
+        const numberCounts = this.countSceneNumbers();
+
         // Add checkboxes and edit buttons to each scene
         const sceneItems = scenesList.querySelectorAll('.scene-item');
         sceneItems.forEach((sceneItem, index) => {
@@ -178,7 +181,7 @@ class Phase2Manager {
 
             // Add conflict indicator if duplicate scene number
             const scene = this.app.currentAnalysis.scenes[index];
-            if (this.isDuplicateSceneNumber(scene)) {
+            if (this.isDuplicateSceneNumber(scene, numberCounts)) {
                 if (!sceneItem.querySelector('.conflict-indicator')) {
                     const conflictIndicator = document.createElement('div');
                     conflictIndicator.className = 'conflict-indicator';
@@ -530,12 +533,23 @@ class Phase2Manager {
 
     /**
      * Check if scene has duplicate number
+     * Pass counts from countSceneNumbers() when checking many scenes
      */
-    isDuplicateSceneNumber(scene) {
+    isDuplicateSceneNumber(scene, numberCounts = this.countSceneNumbers()) {
         if (!scene.number) return false;
         
-        const scenesWithSameNumber = this.app.currentAnalysis.scenes.filter(s => s.number === scene.number);
-        return scenesWithSameNumber.length > 1;
+        return (numberCounts.get(scene.number) || 0) > 1;
+    }
+
+    /**
+     * Count how many scenes use each scene number
+     */
+    countSceneNumbers() {
+        const counts = new Map();
+        for (const scene of this.app.currentAnalysis.scenes) {
+            counts.set(scene.number, (counts.get(scene.number) || 0) + 1);
+        }
+        return counts;
     }
 
     /**
@@ -932,7 +946,7 @@ class Phase2Manager {
             this.characterMappings.set(oldName, newName);
         });
 
-        console.log(`Merged characters: ${oldNames.join(', ')} -> ${newName}`);
+        console.log('Merged characters:', oldNames, '->', newName);
     }
 
     /**
@@ -950,11 +964,7 @@ class Phase2Manager {
         const oldNames = locationsToMerge.map(l => l.name);
         
         // Create merged location
-        const mergedLocation = {
-            name: newName,
-            scenes: [],
-            totalUses: 0
-        };
+        const mergedLocation = new Location(newName);
         
         const allScenes = new Set();
         locationsToMerge.forEach(loc => {
@@ -994,7 +1004,7 @@ class Phase2Manager {
             this.locationMappings.set(oldName, newName);
         });
 
-        console.log(`Merged locations: ${oldNames.join(', ')} -> ${newName}`);
+        console.log('Merged locations:', oldNames, '->', newName);
     }
 
     /**
@@ -1318,17 +1328,17 @@ class Phase2Manager {
         const scenes = this.app.currentAnalysis.scenes;
 
         scenes.forEach(scene => {
-            const originalCharacters = [...scene.characters];
-            scene.characters = scene.characters.map(charName => {
+            // Map and remove duplicates in one pass, keeping first-seen order
+            const characters = new Set();
+            for (const charName of scene.characters) {
                 if (this.characterMappings.has(charName)) {
                     changeCount++;
-                    return this.characterMappings.get(charName);
+                    characters.add(this.characterMappings.get(charName));
+                } else {
+                    characters.add(charName);
                 }
-                return charName;
-            });
-
-            // Remove duplicates
-            scene.characters = [...new Set(scene.characters)];
+            }
+            scene.characters = Array.from(characters);
         });
 
         return changeCount;
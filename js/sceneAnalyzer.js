@@ -118,11 +118,15 @@ class SceneAnalyzer {
             }
         }
 
-        // Re-sort scenes by number
-        this.scenes.sort((a, b) => {
-            const aNum = parseInt(a.number) || 0;
-            const bNum = parseInt(b.number) || 0;
-            return aNum - bNum;
+        // Re-sort scenes by number, parsing each number once instead of per comparison
+        const decorated = this.scenes.map((scene, index) => ({
+            key: parseInt(scene.number) || 0,
+            index: index,
+            scene: scene
+        }));
+        decorated.sort((a, b) => a.key - b.key || a.index - b.index);
+        decorated.forEach((entry, i) => {
+            this.scenes[i] = entry.scene;
         });
     }
 
@@ -169,23 +173,27 @@ class SceneAnalyzer {
     getScenes(criteria = {}) {
         let filteredScenes = [...this.scenes];
 
+        // Lowercase each search term once rather than once per scene
         if (criteria.location) {
+            const location = criteria.location.toLowerCase();
             filteredScenes = filteredScenes.filter(scene =>
-                scene.location && scene.location.toLowerCase().includes(criteria.location.toLowerCase())
+                scene.location && scene.location.toLowerCase().includes(location)
             );
         }
 
         if (criteria.character) {
+            const character = criteria.character.toLowerCase();
             filteredScenes = filteredScenes.filter(scene =>
                 scene.characters.some(char => 
-                    char.toLowerCase().includes(criteria.character.toLowerCase())
+                    char.toLowerCase().includes(character)
                 )
             );
         }
 
         if (criteria.timeOfDay) {
+            const timeOfDay = criteria.timeOfDay.toLowerCase();
             filteredScenes = filteredScenes.filter(scene =>
-                scene.timeOfDay && scene.timeOfDay.toLowerCase().includes(criteria.timeOfDay.toLowerCase())
+                scene.timeOfDay && scene.timeOfDay.toLowerCase().includes(timeOfDay)
             );
         }
 
@@ -213,25 +221,22 @@ class SceneAnalyzer {
             return null;
         }
 
-        const characterScenes = this.scenes.filter(scene =>
-            character.scenes.includes(scene.id)
-        );
-
-        const totalScreenTime = characterScenes.reduce((sum, scene) =>
-            sum + scene.estimatedLength, 0
-        );
-
-        const locations = new Set(
-            characterScenes
-                .filter(scene => scene.location)
-                .map(scene => scene.location)
-        );
+        const sceneIds = new Set(character.scenes);
+        const characterScenes = this.scenes.filter(scene => sceneIds.has(scene.id));
 
-        const timesOfDay = new Set(
-            characterScenes
-                .filter(scene => scene.timeOfDay)
-                .map(scene => scene.timeOfDay)
-        );
+        // Aggregate screen time, locations and times of day in one pass
+        let totalScreenTime = 0;
+        const locations = new Set();
+        const timesOfDay = new Set();
+        for (const scene of characterScenes) {
+            totalScreenTime += scene.estimatedLength;
+            if (scene.location) {
+                locations.add(scene.location);
+            }
+            if (scene.timeOfDay) {
+                timesOfDay.add(scene.timeOfDay);
+            }
+        }
 
         return {
             character: character,
@@ -255,24 +260,20 @@ class SceneAnalyzer {
             return null;
         }
 
-        const locationScenes = this.scenes.filter(scene =>
-            location.scenes.includes(scene.id)
-        );
-
-        const totalScreenTime = locationScenes.reduce((sum, scene) =>
-            sum + scene.estimatedLength, 0
-        );
+        const sceneIds = new Set(location.scenes);
+        const locationScenes = this.scenes.filter(scene => sceneIds.has(scene.id));
 
+        // Aggregate screen time, characters and times of day in one pass
+        let totalScreenTime = 0;
         const characters = new Set();
-        locationScenes.forEach(scene => {
+        const timesOfDay = new Set();
+        for (const scene of locationScenes) {
+            totalScreenTime += scene.estimatedLength;
             scene.characters.forEach(char => characters.add(char));
-        });
-
-        const timesOfDay = new Set(
-            locationScenes
-                .filter(scene => scene.timeOfDay)
-                .map(scene => scene.timeOfDay)
-        );
+            if (scene.timeOfDay) {
+                timesOfDay.add(scene.timeOfDay);
+            }
+        }
 
         return {
             location: location,
@@ -288,12 +289,14 @@ class SceneAnalyzer {
 
     /**
      * Export analysis data
+     * Model instances are returned as-is; JSON.stringify calls their toJSON()
+     * while serializing, so no intermediate copy of every scene is built.
      */
     exportData(format = 'json') {
         const data = {
-            scenes: this.scenes.map(scene => scene.toJSON()),
-            characters: Array.from(this.characters.values()).map(char => char.toJSON()),
-            locations: Array.from(this.locations.values()).map(loc => loc.toJSON()),
+            scenes: this.scenes,
+            characters: Array.from(this.characters.values()),
+            locations: Array.from(this.locations.values()),
             summary: this.generateSummary(),
             metadata: {
                 exportDate: new Date().toISOString(),
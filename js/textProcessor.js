@@ -2,16 +2,51 @@
  * Text processing utilities for screenplay analysis
  */
 
+// Scene number leading a slugline, e.g. "12 INT. HOUSE - DAY"
+const LEADING_SCENE_NUMBER_PATTERN = /^\s*(\d+)\s*[A-Z]/;
+// A line holding only a scene number
+const SCENE_NUMBER_LINE_PATTERN = /^\s*(\d+)\s*$/;
+
+// cleanText patterns
+const WHITESPACE_RUN_PATTERN = /\s+/g;
+const NON_PRINTABLE_PATTERN = /[^\x20-\x7E\n\r\t]/g;
+const CRLF_PATTERN = /\r\n/g;
+const CR_PATTERN = /\r/g;
+const EXCESS_NEWLINES_PATTERN = /\n{3,}/g;
+
 class TextProcessor {
     constructor() {
-        this.sceneBreakPatterns = [
+        // Frozen: matching uses the fused patterns built from these below
+        this.sceneBreakPatterns = Object.freeze([
             // Standard sluglines
             /^(INT\.|EXT\.)\s+.+\s*-\s*.+$/i,
             // Scene numbers
             /^\s*\d+\s+(INT\.|EXT\.)/i,
             // Alternative patterns
             /^(INTERIOR|EXTERIOR)\s+.+\s*-\s*.+$/i
-        ];
+        ]);
+
+        this.pageBreakPatterns = Object.freeze([
+            /^\s*\d+\s*$/i,  // Just a number
+            /page\s+\d+/i,  // "Page 1", etc.
+            /^\s*-\s*\d+\s*-\s*$/i  // "- 1 -", etc.
+        ]);
+
+        // Each pattern list fused into one alternation so a line is tested once
+        this.sceneBreakPattern = this.combinePatterns(this.sceneBreakPatterns);
+        this.pageBreakPattern = this.combinePatterns(this.pageBreakPatterns);
+    }
+
+    /**
+     * Combine patterns into a single alternation
+     * All patterns must share the same flags, which the combined pattern keeps
+     */
+    combinePatterns(patterns) {
+        const flags = patterns[0].flags;
+        if (patterns.some(pattern => pattern.flags !== flags)) {
+            throw new Error('Cannot combine patterns with different flags');
+        }
+        return new RegExp(patterns.map(pattern => `(?:${pattern.source})`).join('|'), flags);
     }
 
     /**
@@ -94,20 +129,14 @@ class TextProcessor {
      * Check if a line indicates a scene break
      */
     isSceneBreak(line) {
-        return this.sceneBreakPatterns.some(pattern => pattern.test(line));
+        return this.sceneBreakPattern.test(line);
     }
 
     /**
      * Check if a line indicates a page break
      */
     isPageBreak(line) {
-        const pageBreakPatterns = [
-            /^\s*\d+\s*$/,  // Just a number
-            /page\s+\d+/i,  // "Page 1", etc.
-            /^\s*-\s*\d+\s*-\s*$/  // "- 1 -", etc.
-        ];
-
-        return pageBreakPatterns.some(pattern => pattern.test(line));
+        return this.pageBreakPattern.test(line);
     }
 
     /**
@@ -115,7 +144,7 @@ class TextProcessor {
      */
     extractSceneNumber(line, lineIndex, allLines) {
         // Pattern 1: Scene number at the beginning of slugline
-        let match = line.match(/^\s*(\d+)\s*[A-Z]/);
+        let match = line.match(LEADING_SCENE_NUMBER_PATTERN);
         if (match) {
             return parseInt(match[1]);
         }
@@ -123,7 +152,7 @@ class TextProcessor {
         // Pattern 2: Scene number on previous line
         if (lineIndex > 0) {
             const prevLine = allLines[lineIndex - 1].trim();
-            match = prevLine.match(/^\s*(\d+)\s*$/);
+            match = prevLine.match(SCENE_NUMBER_LINE_PATTERN);
             if (match) {
                 return parseInt(match[1]);
             }
@@ -132,7 +161,7 @@ class TextProcessor {
         // Pattern 3: Scene number on next line
         if (lineIndex < allLines.length - 1) {
             const nextLine = allLines[lineIndex + 1].trim();
-            match = nextLine.match(/^\s*(\d+)\s*$/);
+            match = nextLine.match(SCENE_NUMBER_LINE_PATTERN);
             if (match) {
                 return parseInt(match[1]);
             }
@@ -149,14 +178,14 @@ class TextProcessor {
 
         return text
             // Remove excessive whitespace
-            .replace(/\s+/g, ' ')
+            .replace(WHITESPACE_RUN_PATTERN, ' ')
             // Remove common PDF artifacts
-            .replace(/[^\x20-\x7E\n\r\t]/g, '')
+            .replace(NON_PRINTABLE_PATTERN, '')
             // Normalize line endings
-            .replace(/\r\n/g, '\n')
-            .replace(/\r/g, '\n')
+            .replace(CRLF_PATTERN, '\n')
+            .replace(CR_PATTERN, '\n')
             // Remove multiple consecutive newlines
-            .replace(/\n{3,}/g, '\n\n')
+            .replace(EXCESS_NEWLINES_PATTERN, '\n\n')
             .trim();
     }
 
@@ -169,29 +198,50 @@ class TextProcessor {
         }
 
         const chunks = [];
-        const lines = text.split('\n');
-        let currentChunk = '';
+        const lines = [];
+        // Split any line longer than a chunk so no chunk can exceed maxChunkSize
+        for (const line of text.split('\n')) {
+            if (line.length <= maxChunkSize) {
+                lines.push(line);
+                continue;
+            }
+            for (let start = 0; start < line.length; start += maxChunkSize) {
+                lines.push(line.slice(start, start + maxChunkSize));
+            }
+        }
+        // Lines of the current chunk and the length they will have once joined
+        let currentLines = [];
+        let currentLength = 0;
+
+        const pushChunk = () => {
+            const chunk = currentLines.join('\n').trim();
+            if (chunk) {
+                chunks.push(chunk);
+            }
+        };
 
         for (const line of lines) {
             // If adding this line would exceed the chunk size
-            if (currentChunk.length + line.length + 1 > maxChunkSize) {
+            if (currentLength + line.length + 1 > maxChunkSize) {
                 // If we have accumulated content, save it as a chunk
-                if (currentChunk.trim()) {
-                    chunks.push(currentChunk.trim());
-                }
+                pushChunk();
                 
                 // Start new chunk with current line
-                currentChunk = line;
+                currentLines = [line];
+                currentLength = line.length;
+            } else if (currentLength === 0) {
+                // Nothing but empty lines so far; the chunk starts here
+                currentLines = [line];
+                currentLength = line.length;
             } else {
                 // Add line to current chunk
-                currentChunk += (currentChunk ? '\n' : '') + line;
+                currentLines.push(line);
+                currentLength += 1 + line.length;
             }
         }
 
         // Don't forget the last chunk
-        if (currentChunk.trim()) {
-            chunks.push(currentChunk.trim());
-        }
+        pushChunk();
 
         return chunks;
     }
@@ -208,33 +258,41 @@ class TextProcessor {
             return sceneChunks[0];
         }
 
-        const mergedScenes = [];
-        const sceneMap = new Map();
+        const merged = new Map();
 
-        // Process each chunk
+        // Single pass: collect content and characters per scene key
         for (const scenes of sceneChunks) {
             for (const scene of scenes) {
                 const key = `${scene.number || 'unknown'}_${scene.location}_${scene.timeOfDay}`;
-                
-                if (sceneMap.has(key)) {
+                const entry = merged.get(key);
+
+                if (entry) {
                     // Merge with existing scene
-                    const existingScene = sceneMap.get(key);
-                    existingScene.content += '\n\n' + scene.content;
-                    
-                    // Merge characters
-                    const allCharacters = new Set([...existingScene.characters, ...scene.characters]);
-                    existingScene.characters = Array.from(allCharacters);
-                    
-                    // Update length estimate
-                    existingScene.estimateLength();
+                    entry.contents.push(scene.content);
+                    scene.characters.forEach(name => entry.characters.add(name));
                 } else {
                     // Add new scene
-                    sceneMap.set(key, scene);
+                    merged.set(key, {
+                        scene: scene,
+                        contents: [scene.content],
+                        characters: new Set(scene.characters)
+                    });
                 }
             }
         }
 
-        return Array.from(sceneMap.values()).sort((a, b) => {
+        // Materialize each merged scene once
+        const mergedScenes = [];
+        for (const { scene, contents, characters } of merged.values()) {
+            if (contents.length > 1) {
+                scene.content = contents.join('\n\n');
+                scene.characters = Array.from(characters);
+                scene.estimateLength();
+            }
+            mergedScenes.push(scene);
+        }
+
+        return mergedScenes.sort((a, b) => {
             // Sort by scene number if available, otherwise by page number
             const aNum = a.number || a.pageNumber || 0;
             const bNum = b.number || b.pageNumber || 0;
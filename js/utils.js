@@ -2,6 +2,16 @@
  * Utility functions for security and common operations
  */
 
+// Replacement for each HTML special character, applied in a single scan
+const HTML_ESCAPES = {
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#039;'
+};
+const HTML_ESCAPE_PATTERN = /[&<>"']/g;
+
 /**
  * Escapes HTML special characters to prevent XSS attacks
  * @param {string} unsafe - The unsafe string that may contain HTML
@@ -12,12 +22,7 @@ function escapeHtml(unsafe) {
         return String(unsafe || '');
     }
     
-    return unsafe
-        .replace(/&/g, "&amp;")
-        .replace(/</g, "&lt;")
-        .replace(/>/g, "&gt;")
-        .replace(/"/g, "&quot;")
-        .replace(/'/g, "&#039;");
+    return unsafe.replace(HTML_ESCAPE_PATTERN, char => HTML_ESCAPES[char]);
 }
 
 /**